@@ -12,10 +12,23 @@ use vitalis_core::{
     ImportResponse, ParsePreviewResponse, WindowStatsItem,
 };
 
+/// Run a blocking vitalis-core call on the blocking thread pool so file
+/// reads and parsing do not stall the async runtime workers
+async fn run_blocking<T, F>(f: F) -> Result<T, String>
+where
+    F: FnOnce() -> Result<T, String> + Send + 'static,
+    T: Send + 'static,
+{
+    tauri::async_runtime::spawn_blocking(f)
+        .await
+        .map_err(|e| e.to_string())?
+}
+
 // Tauri command handlers - vitalis-coreのAPI関数をラップ
 #[tauri::command]
 async fn tauri_parse_and_import(content: String, format: String) -> Result<ImportResponse, String> {
-    parse_and_import(content, format).map_err(|e| e.to_string())
+    // Parsing is CPU-bound; keep it off the async runtime workers
+    run_blocking(move || parse_and_import(content, format)).await
 }
 
 #[tauri::command]
@@ -23,7 +36,7 @@ async fn tauri_parse_preview(
     content: String,
     format: String,
 ) -> Result<ParsePreviewResponse, String> {
-    parse_preview(content, format).map_err(|e| e.to_string())
+    run_blocking(move || parse_preview(content, format)).await
 }
 
 #[tauri::command]
@@ -32,12 +45,13 @@ async fn tauri_import_sequence(
     format: String,
     sequence_index: usize,
 ) -> Result<ImportResponse, String> {
-    import_sequence(content, format, sequence_index).map_err(|e| e.to_string())
+    run_blocking(move || import_sequence(content, format, sequence_index)).await
 }
 
 #[tauri::command]
 async fn tauri_import_from_file(request: ImportFromFileRequest) -> Result<ImportResponse, String> {
-    import_from_file(request).map_err(|e| e.to_string())
+    // File indexing is blocking I/O; keep it off the async runtime workers
+    run_blocking(move || import_from_file(request)).await
 }
 
 #[tauri::command]
@@ -46,26 +60,27 @@ async fn tauri_get_window(
     start: usize,
     end: usize,
 ) -> Result<vitalis_core::WindowResponse, String> {
-    get_window(seq_id, start, end).map_err(|e| e.to_string())
+    // File-backed sequences are read from disk
+    run_blocking(move || get_window(seq_id, start, end)).await
 }
 
 #[tauri::command]
 async fn tauri_stats(seq_id: String) -> Result<vitalis_core::SequenceStats, String> {
-    stats(seq_id).map_err(|e| e.to_string())
+    run_blocking(move || stats(seq_id)).await
 }
 
 #[tauri::command]
 async fn tauri_detailed_stats(
     seq_id: String,
 ) -> Result<vitalis_core::DetailedStatsResponse, String> {
-    detailed_stats(seq_id).map_err(|e| e.to_string())
+    run_blocking(move || detailed_stats(seq_id)).await
 }
 
 #[tauri::command]
 async fn tauri_detailed_stats_enhanced(
     seq_id: String,
 ) -> Result<DetailedStatsEnhancedResponse, String> {
-    detailed_stats_enhanced(seq_id).map_err(|e| e.to_string())
+    run_blocking(move || detailed_stats_enhanced(seq_id)).await
 }
 
 #[tauri::command]
@@ -74,12 +89,12 @@ async fn tauri_window_stats(
     window_size: usize,
     step: usize,
 ) -> Result<Vec<WindowStatsItem>, String> {
-    window_stats(seq_id, window_size, step).map_err(|e| e.to_string())
+    run_blocking(move || window_stats(seq_id, window_size, step)).await
 }
 
 #[tauri::command]
 async fn tauri_export(seq_id: String, format: String) -> Result<ExportResponse, String> {
-    export(seq_id, format).map_err(|e| e.to_string())
+    run_blocking(move || export(seq_id, format)).await
 }
 
 #[tauri::command]
@@ -94,12 +109,12 @@ async fn tauri_storage_info() -> Result<serde_json::Value, String> {
 
 #[tauri::command]
 async fn tauri_read_file(file_path: String) -> Result<String, String> {
-    std::fs::read_to_string(&file_path).map_err(|e| e.to_string())
+    run_blocking(move || std::fs::read_to_string(&file_path).map_err(|e| e.to_string())).await
 }
 
 #[tauri::command]
 async fn tauri_get_genbank_metadata(content: String) -> Result<GenBankMetadata, String> {
-    get_genbank_metadata(content).map_err(|e| e.to_string())
+    run_blocking(move || get_genbank_metadata(content)).await
 }
 
 #[tauri::command]
@@ -109,7 +124,9 @@ async fn tauri_design_primers(
     end: usize,
     params: Option<PrimerDesignParams>,
 ) -> Result<PrimerDesignResult, String> {
-    design_primers(seq_id, start, end, params).map_err(|e| e.to_string())
+    // Reads the region from disk and scores every primer pair under the
+    // service locks; keep it off the async runtime workers
+    run_blocking(move || design_primers(seq_id, start, end, params)).await
 }
 
 #[tauri::command]
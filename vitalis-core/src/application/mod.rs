@@ -3,7 +3,7 @@ use crate::domain::{
     primer::{PrimerDesignParams, PrimerDesignResult, PrimerDesignService},
     DetailedStats, SequenceAnalysisService, SequenceRepository, Topology, WindowStats,
 };
-use crate::infrastructure::{FileSequenceRepository, GenBankParser};
+use crate::infrastructure::{FileSequenceRepository, GenBankFeature, GenBankParser};
 use crate::services::{PrimerDesignServiceImpl, StatsServiceImpl};
 use serde::{Deserialize, Serialize};
 use std::path::Path;
@@ -50,12 +50,8 @@ pub struct GenBankMetadata {
     pub features: Vec<GenBankFeatureInfo>,
 }
 
-#[derive(Debug, Serialize, Deserialize)]
-pub struct GenBankFeatureInfo {
-    pub feature_type: String,
-    pub location: String,
-    pub qualifiers: std::collections::HashMap<String, String>,
-}
+/// Parsed features already have the response shape, so they are returned as-is
+pub type GenBankFeatureInfo = GenBankFeature;
 
 #[derive(Debug, Serialize, Deserialize)]
 pub struct SequenceStats {
@@ -187,19 +183,18 @@ pub fn parse_preview(text: String, fmt: String) -> Result<ParsePreviewResponse,
         "genbank" => {
             let parser = GenBankParser::new();
             let record = parser.parse(&text).map_err(|e| e.to_string())?;
-            let sequence = parser.to_sequence(&record);
-            vec![sequence]
+            vec![parser.into_sequence(record)]
         }
         _ => return Err(format!("Unsupported format: {}", fmt)),
     };
 
     let sequence_info: Vec<SequenceInfo> = sequences
-        .iter()
+        .into_iter()
         .map(|seq| SequenceInfo {
-            id: seq.id.clone(),
-            name: seq.name.clone(),
             length: seq.sequence.len(),
             preview: seq.sequence.chars().take(50).collect(),
+            id: seq.id,
+            name: seq.name,
         })
         .collect();
 
@@ -218,14 +213,13 @@ pub fn import_sequence(
     let mut service = SERVICE.lock().map_err(|e| e.to_string())?;
     let repository = service.get_repository_mut();
 
-    let sequences = match fmt.as_str() {
+    let mut sequences = match fmt.as_str() {
         "fasta" => repository.parse_fasta(&text).map_err(|e| e.to_string())?,
         "fastq" => repository.parse_fastq(&text).map_err(|e| e.to_string())?,
         "genbank" => {
             let parser = GenBankParser::new();
             let record = parser.parse(&text).map_err(|e| e.to_string())?;
-            let sequence = parser.to_sequence(&record);
-            vec![sequence]
+            vec![parser.into_sequence(record)]
         }
         _ => return Err(format!("Unsupported format: {}", fmt)),
     };
@@ -234,24 +228,24 @@ pub fn import_sequence(
         return Err("Sequence index out of range".to_string());
     }
 
-    let sequence = &sequences[sequence_index];
+    let sequence = sequences.swap_remove(sequence_index);
     let seq_id = repository.generate_id();
 
     // Store in memory
-    repository.sequences.insert(
-        seq_id.clone(),
-        crate::infrastructure::storage::SequenceSource::Memory(sequence.sequence.clone()),
-    );
     repository.metadata.insert(
         seq_id.clone(),
         crate::domain::SequenceMetadata {
-            id: sequence.id.clone(),
-            name: sequence.name.clone(),
+            id: sequence.id,
+            name: sequence.name,
             length: sequence.sequence.len(),
-            topology: sequence.topology.clone(),
+            topology: sequence.topology,
             file_path: None,
         },
     );
+    repository.sequences.insert(
+        seq_id.clone(),
+        crate::infrastructure::storage::SequenceSource::Memory(sequence.sequence),
+    );
 
     Ok(ImportResponse { seq_id })
 }
@@ -274,14 +268,11 @@ pub fn get_meta(seq_id: String) -> Result<SequenceMeta, String> {
 
     match repository.get_metadata(&seq_id) {
         Some(meta) => Ok(SequenceMeta {
-            id: meta.id.clone(),
-            name: meta.name.clone(),
+            id: meta.id,
+            name: meta.name,
             length: meta.length,
-            topology: meta.topology.clone(),
-            file_path: meta
-                .file_path
-                .as_ref()
-                .map(|p| p.to_string_lossy().to_string()),
+            topology: meta.topology,
+            file_path: meta.file_path.map(|p| p.to_string_lossy().into_owned()),
         }),
         None => Err(format!("Sequence not found: {}", seq_id)),
     }
@@ -292,16 +283,6 @@ pub fn get_genbank_metadata(text: String) -> Result<GenBankMetadata, String> {
     let parser = GenBankParser::new();
     let record = parser.parse(&text).map_err(|e| e.to_string())?;
 
-    let features = record
-        .features
-        .into_iter()
-        .map(|f| GenBankFeatureInfo {
-            feature_type: f.feature_type,
-            location: f.location,
-            qualifiers: f.qualifiers,
-        })
-        .collect();
-
     Ok(GenBankMetadata {
         accession: record.accession,
         version: record.version,
@@ -310,7 +291,7 @@ pub fn get_genbank_metadata(text: String) -> Result<GenBankMetadata, String> {
         organism: record.organism,
         length: record.length,
         topology: record.topology,
-        features,
+        features: record.features,
     })
 }
 
@@ -435,17 +416,25 @@ pub fn export(seq_id: String, fmt: String) -> Result<ExportResponse, String> {
         .get_sequence(&seq_id)
         .map_err(|e| e.to_string())?;
 
+    // Output is written into a single buffer sized up front
+    let header_len = metadata.id.len() + metadata.name.len() + 3;
     let text = match fmt.as_str() {
         "fasta" => {
-            format!(">{} {}\n{}\n", metadata.id, metadata.name, sequence)
+            let mut text = String::with_capacity(header_len + sequence.len() + 1);
+            push_header(&mut text, '>', &metadata.id, &metadata.name);
+            text.push_str(&sequence);
+            text.push('\n');
+            text
         }
         "fastq" => {
+            let mut text = String::with_capacity(header_len + 2 * sequence.len() + 4);
+            push_header(&mut text, '@', &metadata.id, &metadata.name);
+            text.push_str(&sequence);
+            text.push_str("\n+\n");
             // For FASTQ, we need quality scores - generate dummy if not available
-            let dummy_quality = "I".repeat(sequence.len());
-            format!(
-                "@{} {}\n{}\n+\n{}\n",
-                metadata.id, metadata.name, sequence, dummy_quality
-            )
+            text.extend(std::iter::repeat_n('I', sequence.len()));
+            text.push('\n');
+            text
         }
         _ => return Err(format!("Unsupported export format: {}", fmt)),
     };
@@ -453,6 +442,14 @@ pub fn export(seq_id: String, fmt: String) -> Result<ExportResponse, String> {
     Ok(ExportResponse { text })
 }
 
+fn push_header(text: &mut String, marker: char, id: &str, name: &str) {
+    text.push(marker);
+    text.push_str(id);
+    text.push(' ');
+    text.push_str(name);
+    text.push('\n');
+}
+
 /// Design primers for a specific sequence region
 pub fn design_primers(
     seq_id: String,
@@ -600,6 +597,18 @@ mod tests {
         assert!(exported.text.contains("ATCG"));
     }
 
+    #[test]
+    fn test_export_exact_output() {
+        let fasta_content = ">test_seq Test\nATCG".to_string();
+        let result = parse_and_import(fasta_content, "fasta".to_string()).unwrap();
+
+        let fasta = export(result.seq_id.clone(), "fasta".to_string()).unwrap();
+        assert_eq!(fasta.text, ">test_seq Test\nATCG\n");
+
+        let fastq = export(result.seq_id, "fastq".to_string()).unwrap();
+        assert_eq!(fastq.text, "@test_seq Test\nATCG\n+\nIIII\n");
+    }
+
     #[test]
     fn test_file_import() {
         // Create a temporary FASTA file
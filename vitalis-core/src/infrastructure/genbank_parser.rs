@@ -1,7 +1,9 @@
 use crate::domain::{Sequence, SequenceMetadata, Topology};
+use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
+use std::path::Path;
 
-#[derive(Debug, Clone)]
+#[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct GenBankFeature {
     pub feature_type: String,
     pub location: String,
@@ -25,6 +27,32 @@ pub struct GenBankRecord {
     pub sequence: String,
 }
 
+/// Files with fewer records than this are parsed on the calling thread
+const PARALLEL_MIN_RECORDS: usize = 8;
+
+/// Column-based indents of the flat file format
+const FEATURE_INDENT: &str = "     ";
+const QUALIFIER_INDENT: &str = "                     ";
+const CONTINUATION_INDENT: &str = "            ";
+
+/// Sub-keyword of the SOURCE section, including its indent
+const ORGANISM_PREFIX: &str = "  ORGANISM";
+
+/// Top-level section the parser is currently in
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+enum Section {
+    None,
+    Locus,
+    Definition,
+    Accession,
+    Version,
+    Source,
+    Features,
+    Origin,
+    /// A section this parser does not read (REFERENCE, COMMENT, ...)
+    Other,
+}
+
 pub struct GenBankParser;
 
 impl GenBankParser {
@@ -32,8 +60,58 @@ impl GenBankParser {
         Self
     }
 
+    /// Parse every record of a GenBank flat file.
+    ///
+    /// The file is read as bytes once and split on `//` terminator lines;
+    /// each record slice is validated as UTF-8 and parsed in place, so the
+    /// file is never copied into one large `String`. Records are
+    /// independent, so larger files are parsed on several threads.
+    pub fn parse_file(&self, path: &Path) -> Result<Vec<GenBankRecord>, String> {
+        let bytes = std::fs::read(path).map_err(|e| e.to_string())?;
+        let records = split_records(&bytes);
+
+        let workers = std::thread::available_parallelism()
+            .map_or(1, |n| n.get())
+            .min(records.len());
+        if records.len() < PARALLEL_MIN_RECORDS || workers < 2 {
+            return records
+                .into_iter()
+                .map(|record| self.parse_record_bytes(record))
+                .collect();
+        }
+
+        // Contiguous chunks per thread keep the records in file order
+        let chunk_size = records.len().div_ceil(workers);
+        std::thread::scope(|scope| {
+            let handles: Vec<_> = records
+                .chunks(chunk_size)
+                .map(|chunk| {
+                    scope.spawn(move || {
+                        chunk
+                            .iter()
+                            .map(|record| self.parse_record_bytes(record))
+                            .collect::<Result<Vec<_>, String>>()
+                    })
+                })
+                .collect();
+
+            let mut parsed = Vec::with_capacity(records.len());
+            for handle in handles {
+                let chunk = handle
+                    .join()
+                    .map_err(|_| "GenBank parser thread panicked".to_string())??;
+                parsed.extend(chunk);
+            }
+            Ok(parsed)
+        })
+    }
+
+    fn parse_record_bytes(&self, record: &[u8]) -> Result<GenBankRecord, String> {
+        let content = std::str::from_utf8(record).map_err(|e| e.to_string())?;
+        self.parse(content)
+    }
+
     pub fn parse(&self, content: &str) -> Result<GenBankRecord, String> {
-        let lines: Vec<&str> = content.lines().collect();
         let mut record = GenBankRecord {
             locus: String::new(),
             definition: String::new(),
@@ -50,78 +128,118 @@ impl GenBankParser {
             sequence: String::new(),
         };
 
-        let mut current_section = "";
+        let mut current_section = Section::None;
         let mut sequence_section = false;
         let mut current_feature: Option<GenBankFeature> = None;
+        let mut open_qualifier: Option<String> = None;
 
-        for line in lines {
+        for line in content.lines() {
             if line.starts_with("//") {
                 // End of record
-                if let Some(feature) = current_feature {
-                    record.features.push(feature);
-                }
                 break;
             }
 
             if sequence_section {
-                // Parse sequence data
-                let cleaned_line = line
-                    .chars()
-                    .filter(|c| c.is_alphabetic())
-                    .collect::<String>()
-                    .to_uppercase();
-                record.sequence.push_str(&cleaned_line);
+                // Parse sequence data straight into the record; ORIGIN lines
+                // are ASCII, so skip the position numbers and spaces bytewise
+                record.sequence.extend(
+                    line.bytes()
+                        .filter(u8::is_ascii_alphabetic)
+                        .map(|b| char::from(b.to_ascii_uppercase())),
+                );
                 continue;
             }
 
-            if line.starts_with("LOCUS") {
-                current_section = "LOCUS";
-                self.parse_locus_line(line, &mut record)?;
-            } else if line.starts_with("DEFINITION") {
-                current_section = "DEFINITION";
-                record.definition = self.extract_field_value(line, "DEFINITION");
-            } else if line.starts_with("ACCESSION") {
-                current_section = "ACCESSION";
-                record.accession = self.extract_field_value(line, "ACCESSION");
-            } else if line.starts_with("VERSION") {
-                current_section = "VERSION";
-                record.version = self.extract_field_value(line, "VERSION");
-            } else if line.starts_with("SOURCE") {
-                current_section = "SOURCE";
-                record.source = self.extract_field_value(line, "SOURCE");
-            } else if line.starts_with("  ORGANISM") {
-                record.organism = self.extract_field_value(line, "ORGANISM");
-            } else if line.starts_with("FEATURES") {
-                current_section = "FEATURES";
-            } else if line.starts_with("ORIGIN") {
-                current_section = "ORIGIN";
-                sequence_section = true;
-                // Save any pending feature
-                if let Some(feature) = current_feature.take() {
-                    record.features.push(feature);
+            if !line.starts_with(' ') {
+                // Section headers start in column 0; dispatch on the keyword once
+                let keyword = line.split_ascii_whitespace().next().unwrap_or("");
+                match keyword {
+                    "LOCUS" => {
+                        current_section = Section::Locus;
+                        self.parse_locus_line(line, &mut record)?;
+                    }
+                    "DEFINITION" => {
+                        current_section = Section::Definition;
+                        record.definition = self.extract_field_value(line, "DEFINITION");
+                    }
+                    "ACCESSION" => {
+                        current_section = Section::Accession;
+                        record.accession = self.extract_field_value(line, "ACCESSION");
+                    }
+                    "VERSION" => {
+                        current_section = Section::Version;
+                        record.version = self.extract_field_value(line, "VERSION");
+                    }
+                    "SOURCE" => {
+                        current_section = Section::Source;
+                        record.source = self.extract_field_value(line, "SOURCE");
+                    }
+                    "FEATURES" => {
+                        current_section = Section::Features;
+                    }
+                    "ORIGIN" => {
+                        current_section = Section::Origin;
+                        sequence_section = true;
+                        // LOCUS already told us how long the sequence is; the
+                        // record text bounds it in case the header is wrong
+                        record.sequence.reserve(record.length.min(content.len()));
+                        // Save any pending feature
+                        if let Some(feature) = current_feature.take() {
+                            record.features.push(feature);
+                        }
+                    }
+                    // Blank lines do not change the section
+                    "" => {}
+                    // Any other keyword closes the previous section, so its
+                    // indented lines are skipped without further checks
+                    _ => current_section = Section::Other,
                 }
-            } else if current_section == "FEATURES" && !line.trim().is_empty() {
-                // Parse features
-                if line.starts_with("     ") && !line.starts_with("                     ") {
-                    // New feature
-                    if let Some(feature) = current_feature.take() {
-                        record.features.push(feature);
+            } else {
+                // Indented lines only mean something inside their section
+                match current_section {
+                    Section::Source => {
+                        // Check the sub-keyword and take its value in one step
+                        if let Some(value) = line.strip_prefix(ORGANISM_PREFIX) {
+                            record.organism = value.trim().to_string();
+                        }
+                    }
+                    Section::Definition if line.starts_with(CONTINUATION_INDENT) => {
+                        // Continuation of definition
+                        record.definition.push(' ');
+                        record.definition.push_str(line.trim());
                     }
-                    current_feature = self.parse_feature_line(line)?;
-                } else if line.starts_with("                     ") {
-                    // Feature qualifier
-                    if let Some(ref mut feature) = current_feature {
-                        self.parse_feature_qualifier(line, feature)?;
+                    Section::Features => {
+                        if line.starts_with(QUALIFIER_INDENT) {
+                            // Feature qualifier
+                            if let Some(ref mut feature) = current_feature {
+                                self.parse_feature_qualifier(line, feature, &mut open_qualifier);
+                            }
+                        } else if line.starts_with(FEATURE_INDENT) && !line.trim().is_empty() {
+                            // New feature
+                            if let Some(feature) = current_feature.take() {
+                                record.features.push(feature);
+                            }
+                            current_feature = self.parse_feature_line(line);
+                            open_qualifier = None;
+                        }
                     }
+                    _ => {}
                 }
-            } else if current_section == "DEFINITION" && line.starts_with("            ") {
-                // Continuation of definition
-                record.definition.push(' ');
-                record.definition.push_str(line.trim());
             }
         }
 
+        // Finish the record in one place, whether it ended with `//`, ORIGIN
+        // or just ran out of lines
+        if let Some(feature) = current_feature {
+            record.features.push(feature);
+        }
         record.length = record.sequence.len();
+
+        // Records are kept around after parsing, so release the spare
+        // capacity left over from incremental growth
+        record.sequence.shrink_to_fit();
+        record.features.shrink_to_fit();
+
         Ok(record)
     }
 
@@ -137,9 +255,9 @@ impl GenBankParser {
 
             // Parse topology (circular/linear)
             for part in &parts[3..] {
-                if part.to_lowercase() == "circular" {
+                if part.eq_ignore_ascii_case("circular") {
                     record.topology = Topology::Circular;
-                } else if part.to_lowercase() == "linear" {
+                } else if part.eq_ignore_ascii_case("linear") {
                     record.topology = Topology::Linear;
                 }
 
@@ -163,8 +281,10 @@ impl GenBankParser {
     }
 
     fn extract_field_value(&self, line: &str, field_name: &str) -> String {
-        if let Some(start) = line.find(field_name) {
-            let value = line[start + field_name.len()..].trim();
+        // Callers have already matched the field name as the line's first
+        // token, so strip it rather than searching the line for it again
+        if let Some(value) = line.trim_start().strip_prefix(field_name) {
+            let value = value.trim();
             // For ACCESSION field, handle cases like "NC_000913 REGION: 1..5000"
             if field_name == "ACCESSION" {
                 value.split_whitespace().next().unwrap_or(value).to_string()
@@ -176,47 +296,85 @@ impl GenBankParser {
         }
     }
 
-    fn parse_feature_line(&self, line: &str) -> Result<Option<GenBankFeature>, String> {
+    fn parse_feature_line(&self, line: &str) -> Option<GenBankFeature> {
         let trimmed = line.trim();
         if let Some(space_pos) = trimmed.find(' ') {
             let feature_type = trimmed[..space_pos].to_string();
             let location = trimmed[space_pos + 1..].trim().to_string();
 
-            Ok(Some(GenBankFeature {
+            Some(GenBankFeature {
                 feature_type,
                 location,
                 qualifiers: HashMap::new(),
-            }))
+            })
         } else {
-            Ok(None)
+            None
         }
     }
 
+    /// Parse a qualifier line of `feature`.
+    ///
+    /// `open_qualifier` holds the key of a quoted value that has not been
+    /// closed yet, so continuation lines are appended with one map lookup.
     fn parse_feature_qualifier(
         &self,
         line: &str,
         feature: &mut GenBankFeature,
-    ) -> Result<(), String> {
+        open_qualifier: &mut Option<String>,
+    ) {
         let trimmed = line.trim();
         if trimmed.starts_with('/') {
+            *open_qualifier = None;
             if let Some(eq_pos) = trimmed.find('=') {
                 let key = trimmed[1..eq_pos].to_string();
-                let mut value = trimmed[eq_pos + 1..].to_string();
+                let value = &trimmed[eq_pos + 1..];
 
-                // Remove quotes if present
-                if value.starts_with('"') && value.ends_with('"') {
-                    value = value[1..value.len() - 1].to_string();
-                }
+                // Remove quotes if present, allocating only the final value
+                let value = match value.strip_prefix('"') {
+                    Some(quoted) => match quoted.strip_suffix('"') {
+                        Some(closed) => closed,
+                        None => {
+                            // Value continues on the following lines
+                            *open_qualifier = Some(key.clone());
+                            quoted
+                        }
+                    },
+                    None => value,
+                };
 
-                feature.qualifiers.insert(key, value);
+                feature.qualifiers.insert(key, value.to_string());
             } else {
                 // Boolean qualifier
                 feature
                     .qualifiers
                     .insert(trimmed[1..].to_string(), "true".to_string());
             }
+        } else if let Some(key) = open_qualifier.as_deref() {
+            let (part, closed) = match trimmed.strip_suffix('"') {
+                Some(part) => (part, true),
+                None => (trimmed, false),
+            };
+            if let Some(value) = feature.qualifiers.get_mut(key) {
+                // Translations are wrapped amino acid strings, not prose
+                if key != "translation" && !value.is_empty() && !part.is_empty() {
+                    value.push(' ');
+                }
+                value.push_str(part);
+            }
+            if closed {
+                *open_qualifier = None;
+            }
+        }
+    }
+
+    /// Convert a parsed record into a sequence, moving its fields instead of cloning them.
+    pub fn into_sequence(&self, record: GenBankRecord) -> Sequence {
+        Sequence {
+            id: record.accession,
+            name: record.definition,
+            sequence: record.sequence,
+            topology: record.topology,
         }
-        Ok(())
     }
 
     pub fn to_sequence(&self, record: &GenBankRecord) -> Sequence {
@@ -229,6 +387,42 @@ impl GenBankParser {
     }
 }
 
+/// Split a GenBank flat file into record slices, each ending with its `//` line
+fn split_records(bytes: &[u8]) -> Vec<&[u8]> {
+    // Terminator lines are found with one substring scan over the whole
+    // buffer instead of checking every line
+    let finder = memchr::memmem::Finder::new(b"\n//");
+    let mut records = Vec::new();
+    let mut record_start = 0;
+
+    // A terminator on the very first line has no newline before it
+    let mut terminator = if bytes.starts_with(b"//") {
+        Some(0)
+    } else {
+        finder.find(bytes).map(|pos| pos + 1)
+    };
+    while let Some(line_start) = terminator {
+        let line_end = memchr::memchr(b'\n', &bytes[line_start..])
+            .map_or(bytes.len(), |pos| line_start + pos + 1);
+        // Blank or repeated terminators carry no record
+        if !bytes[record_start..line_start].trim_ascii().is_empty() {
+            records.push(&bytes[record_start..line_end]);
+        }
+        record_start = line_end;
+
+        // Resume at the newline ending this line so back-to-back terminators match
+        let resume = line_end - 1;
+        terminator = finder.find(&bytes[resume..]).map(|pos| resume + pos + 1);
+    }
+
+    // Trailing record without a terminator
+    if !bytes[record_start..].trim_ascii().is_empty() {
+        records.push(&bytes[record_start..]);
+    }
+
+    records
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -268,4 +462,128 @@ ORIGIN
         assert!(record.sequence.len() > 0);
         assert!(!record.features.is_empty());
     }
+
+    #[test]
+    fn test_parse_feature_qualifier_quotes() {
+        let parser = GenBankParser::new();
+        let mut feature = GenBankFeature {
+            feature_type: "gene".to_string(),
+            location: "1..10".to_string(),
+            qualifiers: HashMap::new(),
+        };
+
+        let mut open_qualifier = None;
+        for line in [
+            r#"                     /gene="testA""#,
+            r#"                     /codon_start=1"#,
+            r#"                     /note=""#,
+            r#"                     /pseudo"#,
+            r#"                     /product="long product"#,
+            r#"                     name""#,
+            r#"                     /translation="MKVL"#,
+            r#"                     AAGG"#,
+            r#"                     TT""#,
+        ] {
+            parser.parse_feature_qualifier(line, &mut feature, &mut open_qualifier);
+        }
+
+        assert_eq!(feature.qualifiers["gene"], "testA");
+        assert_eq!(feature.qualifiers["codon_start"], "1");
+        assert_eq!(feature.qualifiers["note"], "");
+        assert_eq!(feature.qualifiers["pseudo"], "true");
+        assert_eq!(feature.qualifiers["product"], "long product name");
+        assert_eq!(feature.qualifiers["translation"], "MKVLAAGGTT");
+        assert!(open_qualifier.is_none());
+    }
+
+    #[test]
+    fn test_parse_keeps_last_feature_without_terminator() {
+        let content = concat!(
+            "LOCUS       TRUNC 10 bp    DNA     linear\n",
+            "FEATURES             Location/Qualifiers\n",
+            "     gene            1..10\n",
+            "                     /gene=\"last\"\n",
+        );
+
+        let record = GenBankParser::new().parse(content).unwrap();
+        assert_eq!(record.features.len(), 1);
+        assert_eq!(record.features[0].qualifiers["gene"], "last");
+    }
+
+    #[test]
+    fn test_unknown_sections_end_previous_section() {
+        let content = concat!(
+            "LOCUS       SEC 10 bp    DNA     linear\n",
+            "DEFINITION  Short definition.\n",
+            "KEYWORDS    .\n",
+            "            not part of the definition\n",
+            "SOURCE      Test organism\n",
+            "  ORGANISM  Test organism\n",
+            "FEATURES             Location/Qualifiers\n",
+            "     gene            1..10\n",
+            "\n",
+            "                     /gene=\"after_blank\"\n",
+            "//\n",
+        );
+
+        let record = GenBankParser::new().parse(content).unwrap();
+        assert_eq!(record.definition, "Short definition.");
+        assert_eq!(record.organism, "Test organism");
+        assert_eq!(record.features[0].qualifiers["gene"], "after_blank");
+    }
+
+    #[test]
+    fn test_split_records() {
+        let bytes = b"//\nLOCUS A\n//\n//\n\n//\nLOCUS B\n// end\nLOCUS C\n";
+        let records = split_records(bytes);
+        let expected: [&[u8]; 3] = [b"LOCUS A\n//\n", b"LOCUS B\n// end\n", b"LOCUS C\n"];
+        assert_eq!(records, expected);
+
+        // Terminator without a trailing newline, followed by nothing
+        assert_eq!(split_records(b"LOCUS A\n//"), [b"LOCUS A\n//"]);
+        assert!(split_records(b"\n  \n").is_empty());
+    }
+
+    #[test]
+    fn test_parse_file_multiple_records() {
+        use std::io::Write;
+
+        let record = |acc: &str| {
+            format!(
+                "LOCUS       {acc}                 20 bp    DNA     circular SYN 01-JAN-2024
+DEFINITION  Record {acc}.
+ACCESSION   {acc}
+FEATURES             Location/Qualifiers
+     gene            1..20
+                     /gene=\"{acc}\"
+ORIGIN
+        1 atgcatgcat gcatgcatgc
+//
+"
+            )
+        };
+
+        let mut temp_file = tempfile::NamedTempFile::new().unwrap();
+        writeln!(temp_file, "{}{}", record("REC1"), record("REC2")).unwrap();
+
+        let records = GenBankParser::new().parse_file(temp_file.path()).unwrap();
+        assert_eq!(records.len(), 2);
+        assert_eq!(records[0].accession, "REC1");
+        assert_eq!(records[1].accession, "REC2");
+        assert_eq!(records[1].topology, Topology::Circular);
+        assert_eq!(records[1].sequence, "ATGCATGCATGCATGCATGC");
+        assert_eq!(records[1].features[0].qualifiers["gene"], "REC2");
+
+        // Enough records to take the multi-threaded path, order must be kept
+        let mut temp_file = tempfile::NamedTempFile::new().unwrap();
+        for i in 0..40 {
+            write!(temp_file, "{}", record(&format!("REC{}", i))).unwrap();
+        }
+
+        let records = GenBankParser::new().parse_file(temp_file.path()).unwrap();
+        assert_eq!(records.len(), 40);
+        for (i, record) in records.iter().enumerate() {
+            assert_eq!(record.accession, format!("REC{}", i));
+        }
+    }
 }
@@ -4,5 +4,7 @@ pub mod parsers;
 pub mod storage;
 
 pub use genbank_parser::{GenBankFeature, GenBankParser, GenBankRecord};
-pub use parsers::{FastaParser, FastqParser};
+pub use parsers::{
+    detect_file_format, detect_reader_format, FastaHeaders, FastaParser, FastaRecords, FastqParser,
+};
 pub use storage::FileSequenceRepository;
@@ -1,7 +1,16 @@
 // Infrastructure layer: Parser implementations
 use crate::domain::{Sequence, SequenceParser, Topology};
+use std::fs::File;
+use std::io::Read;
+use std::path::Path;
 use thiserror::Error;
 
+/// Upper bound for a single binary read when parsing files (16 MiB)
+const READ_CHUNK_SIZE: usize = 1 << 24;
+
+/// Number of leading bytes inspected by [`detect_file_format`]
+const FORMAT_SNIFF_LEN: usize = 4096;
+
 #[derive(Error, Debug)]
 pub enum ParserError {
     #[error("Invalid format: {0}")]
@@ -14,6 +23,65 @@ pub enum ParserError {
     IoError(#[from] std::io::Error),
 }
 
+/// Detect the format of a sequence file ("fasta", "fastq" or "genbank").
+///
+/// Only the first few kilobytes are read, so detection cost does not grow
+/// with file size. Falls back to the file extension when the content is
+/// not recognized.
+pub fn detect_file_format(path: &Path) -> Result<&'static str, ParserError> {
+    detect_reader_format(File::open(path)?, path)
+}
+
+/// Detect the format from an already opened reader, using `path` only for
+/// the extension fallback.
+///
+/// Reads at most the first few kilobytes; callers that go on to read the
+/// same file should rewind it afterwards.
+pub fn detect_reader_format<R: Read>(reader: R, path: &Path) -> Result<&'static str, ParserError> {
+    let mut head = Vec::with_capacity(FORMAT_SNIFF_LEN);
+    reader
+        .take(FORMAT_SNIFF_LEN as u64)
+        .read_to_end(&mut head)?;
+
+    if let Some(format) = sniff_format(&head) {
+        return Ok(format);
+    }
+
+    let extension = path
+        .extension()
+        .and_then(|ext| ext.to_str())
+        .map(|ext| ext.to_ascii_lowercase());
+    match extension.as_deref() {
+        Some("fasta" | "fa" | "fna" | "fas") => Ok("fasta"),
+        Some("fastq" | "fq") => Ok("fastq"),
+        Some("gb" | "gbk" | "genbank") => Ok("genbank"),
+        _ => Err(ParserError::InvalidFormat(format!(
+            "Unable to detect format of {}",
+            path.display()
+        ))),
+    }
+}
+
+/// Recognize a format from the raw head of a file, without decoding it
+fn sniff_format(head: &[u8]) -> Option<&'static str> {
+    let head = head.trim_ascii_start();
+    match head.first() {
+        Some(b'>') => return Some("fasta"),
+        Some(b'@') => return Some("fastq"),
+        _ if head.starts_with(b"LOCUS") => return Some("genbank"),
+        _ => {}
+    }
+
+    // Allow a preamble (comments, blank lines) before the first record
+    if memchr::memmem::find(head, b"\nLOCUS").is_some() {
+        Some("genbank")
+    } else if memchr::memmem::find(head, b"\n>").is_some() {
+        Some("fasta")
+    } else {
+        None
+    }
+}
+
 /// FASTA parser implementation
 pub struct FastaParser;
 
@@ -21,50 +89,318 @@ impl SequenceParser for FastaParser {
     type Error = ParserError;
 
     fn parse(&self, content: &str) -> Result<Vec<Sequence>, Self::Error> {
-        let mut sequences = Vec::new();
-        let mut current_id = String::new();
-        let mut current_name = String::new();
-        let mut current_sequence = String::new();
-
-        for line in content.lines() {
-            let line = line.trim();
-            if line.starts_with('>') {
-                // Save previous sequence if exists
-                if !current_id.is_empty() {
-                    sequences.push(Sequence {
-                        id: current_id.clone(),
-                        name: current_name.clone(),
-                        sequence: current_sequence.clone(),
-                        topology: Topology::Linear,
+        // Same byte-level state machine as the file path, walking the input
+        // in place instead of copying it into a chunk buffer
+        let mut reader = FastaReader {
+            lines: SliceLines {
+                bytes: content.as_bytes(),
+            },
+            header: None,
+        };
+        collect_records(std::iter::from_fn(|| {
+            reader
+                .next_raw(true)
+                .transpose()
+                .map(|raw| raw.and_then(into_sequence))
+        }))
+    }
+}
+
+impl FastaParser {
+    /// Parse a FASTA file without decoding it line by line.
+    ///
+    /// Collects [`FastaParser::iter_records`]; use the iterator directly to
+    /// stream records without holding the whole file in memory.
+    pub fn parse_file(&self, path: &Path) -> Result<Vec<Sequence>, ParserError> {
+        collect_records(self.iter_records(path)?)
+    }
+
+    /// Parse a batch of FASTA files, spreading them over the available cores.
+    ///
+    /// Results are returned in the same order as `paths`, one per file, so a
+    /// failure in one file does not discard the others.
+    pub fn parse_files<P: AsRef<Path> + Sync>(
+        &self,
+        paths: &[P],
+    ) -> Vec<Result<Vec<Sequence>, ParserError>> {
+        let workers = std::thread::available_parallelism()
+            .map_or(1, |n| n.get())
+            .min(paths.len());
+        if workers < 2 {
+            return paths
+                .iter()
+                .map(|path| self.parse_file(path.as_ref()))
+                .collect();
+        }
+
+        let chunk_size = paths.len().div_ceil(workers);
+        std::thread::scope(|scope| {
+            let handles: Vec<_> = paths
+                .chunks(chunk_size)
+                .map(|chunk| {
+                    let handle = scope.spawn(move || {
+                        chunk
+                            .iter()
+                            .map(|path| self.parse_file(path.as_ref()))
+                            .collect::<Vec<_>>()
                     });
-                }
+                    (chunk.len(), handle)
+                })
+                .collect();
+
+            handles
+                .into_iter()
+                .flat_map(|(len, handle)| {
+                    // A panicked worker fails only its own files, keeping one
+                    // result per path
+                    handle.join().unwrap_or_else(|_| {
+                        (0..len)
+                            .map(|_| {
+                                Err(ParserError::InvalidFormat(
+                                    "FASTA parser thread panicked".to_string(),
+                                ))
+                            })
+                            .collect()
+                    })
+                })
+                .collect()
+        })
+    }
+
+    /// Iterate over the records of a FASTA file one at a time.
+    ///
+    /// The file is read in large binary chunks and split on `\n`; a partial
+    /// line at the end of a chunk is carried over to the next one. Only
+    /// headers are decoded as UTF-8, sequence lines stay as bytes until the
+    /// record is complete.
+    pub fn iter_records(&self, path: &Path) -> Result<FastaRecords<File>, ParserError> {
+        Ok(FastaRecords {
+            reader: FastaReader::open(path)?,
+        })
+    }
+
+    /// Like [`FastaParser::iter_records`], for a file the caller has already
+    /// opened; reading starts at its current position.
+    pub fn iter_records_from(&self, file: File) -> Result<FastaRecords<File>, ParserError> {
+        Ok(FastaRecords {
+            reader: FastaReader::from_file(file)?,
+        })
+    }
 
-                // Parse new header
-                let header = &line[1..];
-                let parts: Vec<&str> = header.split_whitespace().collect();
-                current_id = parts.first().unwrap_or(&"unknown").to_string();
-                current_name = parts.get(1..).map(|p| p.join(" ")).unwrap_or_default();
-                current_sequence.clear();
-            } else if !line.is_empty() {
-                current_sequence.push_str(line);
+    /// Iterate over `(id, name)` header pairs of a FASTA file.
+    ///
+    /// Sequence lines are skipped without being buffered, so this is the
+    /// cheap path for callers that only need identifiers (counting,
+    /// indexing, deduplication).
+    pub fn iter_headers(&self, path: &Path) -> Result<FastaHeaders<File>, ParserError> {
+        Ok(FastaHeaders {
+            reader: FastaReader::open(path)?,
+        })
+    }
+}
+
+/// Streaming iterator over FASTA records, see [`FastaParser::iter_records`]
+pub struct FastaRecords<R: Read> {
+    reader: FastaReader<ChunkedLines<R>>,
+}
+
+impl<R: Read> Iterator for FastaRecords<R> {
+    type Item = Result<Sequence, ParserError>;
+
+    fn next(&mut self) -> Option<Self::Item> {
+        self.reader
+            .next_raw(true)
+            .transpose()
+            .map(|raw| raw.and_then(into_sequence))
+    }
+}
+
+/// Streaming iterator over FASTA headers, see [`FastaParser::iter_headers`]
+pub struct FastaHeaders<R: Read> {
+    reader: FastaReader<ChunkedLines<R>>,
+}
+
+impl<R: Read> Iterator for FastaHeaders<R> {
+    type Item = Result<(String, String), ParserError>;
+
+    fn next(&mut self) -> Option<Self::Item> {
+        self.reader
+            .next_raw(false)
+            .transpose()
+            .map(|raw| raw.map(|(id, name, _)| (id, name)))
+    }
+}
+
+/// Byte-level FASTA state machine over a line source
+struct FastaReader<L: LineSource> {
+    lines: L,
+    header: Option<(String, String)>,
+}
+
+impl FastaReader<ChunkedLines<File>> {
+    fn open(path: &Path) -> Result<Self, ParserError> {
+        Self::from_file(File::open(path)?)
+    }
+
+    fn from_file(file: File) -> Result<Self, ParserError> {
+        // One byte past the file size lets a file that fits in a single chunk
+        // be read in one call, with the short read signalling EOF
+        let len = file.metadata()?.len() as usize;
+        let chunk_size = len.saturating_add(1).min(READ_CHUNK_SIZE);
+        Ok(Self::new(file, chunk_size))
+    }
+}
+
+impl<R: Read> FastaReader<ChunkedLines<R>> {
+    fn new(reader: R, chunk_size: usize) -> Self {
+        Self {
+            lines: ChunkedLines::new(reader, chunk_size),
+            header: None,
+        }
+    }
+}
+
+impl<L: LineSource> FastaReader<L> {
+    /// Read the next `(id, name, sequence)` record; sequence lines are only
+    /// collected when `keep_sequence` is set
+    fn next_raw(
+        &mut self,
+        keep_sequence: bool,
+    ) -> Result<Option<(String, String, Vec<u8>)>, ParserError> {
+        let mut sequence = Vec::new();
+
+        while let Some(line) = self.lines.next_line()? {
+            let line = line.trim_ascii();
+            if line.first() == Some(&b'>') {
+                let header = parse_header(&line[1..])?;
+                if let Some((id, name)) = self.header.replace(header) {
+                    return Ok(Some((id, name, sequence)));
+                }
+            } else if keep_sequence && self.header.is_some() {
+                sequence.extend_from_slice(line);
             }
         }
 
-        // Save last sequence
-        if !current_id.is_empty() {
-            sequences.push(Sequence {
-                id: current_id,
-                name: current_name,
-                sequence: current_sequence,
-                topology: Topology::Linear,
-            });
+        Ok(self.header.take().map(|(id, name)| (id, name, sequence)))
+    }
+}
+
+/// Turn a raw `(id, name, sequence)` record into a [`Sequence`]
+fn into_sequence(
+    (id, name, mut sequence): (String, String, Vec<u8>),
+) -> Result<Sequence, ParserError> {
+    // Growth leaves up to 2x spare capacity; drop it before the record is kept
+    sequence.shrink_to_fit();
+    String::from_utf8(sequence)
+        .map(|sequence| Sequence {
+            id,
+            name,
+            sequence,
+            topology: Topology::Linear,
+        })
+        .map_err(|e| ParserError::InvalidFormat(format!("Invalid sequence: {}", e)))
+}
+
+fn collect_records(
+    records: impl Iterator<Item = Result<Sequence, ParserError>>,
+) -> Result<Vec<Sequence>, ParserError> {
+    let sequences = records.collect::<Result<Vec<_>, _>>()?;
+    if sequences.is_empty() {
+        return Err(ParserError::InvalidFormat("No sequences found".to_string()));
+    }
+
+    Ok(sequences)
+}
+
+fn parse_header(header: &[u8]) -> Result<(String, String), ParserError> {
+    let header = std::str::from_utf8(header)
+        .map_err(|e| ParserError::InvalidFormat(format!("Invalid header: {}", e)))?;
+    let mut parts = header.split_whitespace();
+    let id = parts.next().unwrap_or("unknown").to_string();
+    let mut name = String::new();
+    for part in parts {
+        if !name.is_empty() {
+            name.push(' ');
         }
+        name.push_str(part);
+    }
+    Ok((id, name))
+}
 
-        if sequences.is_empty() {
-            return Err(ParserError::InvalidFormat("No sequences found".to_string()));
+/// Source of `\n`-terminated lines for [`FastaReader`]
+trait LineSource {
+    fn next_line(&mut self) -> std::io::Result<Option<&[u8]>>;
+}
+
+/// Lines of an in-memory buffer, borrowed without copying
+struct SliceLines<'a> {
+    bytes: &'a [u8],
+}
+
+impl LineSource for SliceLines<'_> {
+    fn next_line(&mut self) -> std::io::Result<Option<&[u8]>> {
+        if self.bytes.is_empty() {
+            return Ok(None);
         }
+        let (line, rest) = match memchr::memchr(b'\n', self.bytes) {
+            Some(pos) => (&self.bytes[..pos], &self.bytes[pos + 1..]),
+            None => (self.bytes, &[][..]),
+        };
+        self.bytes = rest;
+        Ok(Some(line))
+    }
+}
 
-        Ok(sequences)
+/// Splits a reader into `\n`-terminated lines, reading `chunk_size` bytes
+/// at a time and carrying partial lines across chunk boundaries
+struct ChunkedLines<R: Read> {
+    reader: R,
+    buf: Vec<u8>,
+    pos: usize,
+    chunk_size: usize,
+    eof: bool,
+}
+
+impl<R: Read> ChunkedLines<R> {
+    fn new(reader: R, chunk_size: usize) -> Self {
+        Self {
+            reader,
+            buf: Vec::with_capacity(chunk_size),
+            pos: 0,
+            chunk_size,
+            eof: false,
+        }
+    }
+}
+
+impl<R: Read> LineSource for ChunkedLines<R> {
+    fn next_line(&mut self) -> std::io::Result<Option<&[u8]>> {
+        loop {
+            if let Some(offset) = memchr::memchr(b'\n', &self.buf[self.pos..]) {
+                let start = self.pos;
+                self.pos += offset + 1;
+                return Ok(Some(&self.buf[start..start + offset]));
+            }
+
+            if self.eof {
+                if self.pos < self.buf.len() {
+                    let start = self.pos;
+                    self.pos = self.buf.len();
+                    return Ok(Some(&self.buf[start..]));
+                }
+                return Ok(None);
+            }
+
+            // Keep the trailing partial line and append the next chunk into
+            // the spare capacity, without zero-filling it first
+            self.buf.drain(..self.pos);
+            self.pos = 0;
+            let bytes_read = (&mut self.reader)
+                .take(self.chunk_size as u64)
+                .read_to_end(&mut self.buf)?;
+            // take() only stops short at the end of the input
+            self.eof = bytes_read < self.chunk_size;
+        }
     }
 }
 
@@ -109,3 +445,131 @@ impl SequenceParser for FastqParser {
         Ok(sequences)
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use std::io::Write;
+    use tempfile::NamedTempFile;
+
+    #[test]
+    fn test_fasta_parse_file() {
+        let mut temp_file = NamedTempFile::new().unwrap();
+        write!(
+            temp_file,
+            ">seq1 first sequence\nATCG\r\nGGCC\n\n>seq2\nTTAA"
+        )
+        .unwrap();
+
+        let sequences = FastaParser.parse_file(temp_file.path()).unwrap();
+        assert_eq!(sequences.len(), 2);
+        assert_eq!(sequences[0].id, "seq1");
+        assert_eq!(sequences[0].name, "first sequence");
+        assert_eq!(sequences[0].sequence, "ATCGGGCC");
+        assert_eq!(sequences[1].id, "seq2");
+        assert_eq!(sequences[1].sequence, "TTAA");
+
+        // An already opened handle yields the same records
+        let from_handle = FastaParser
+            .iter_records_from(File::open(temp_file.path()).unwrap())
+            .unwrap()
+            .collect::<Result<Vec<_>, _>>()
+            .unwrap();
+        assert_eq!(from_handle, sequences);
+    }
+
+    #[test]
+    fn test_fasta_chunks_match_single_read() {
+        // The second input has CRLF endings and no trailing newline
+        for content in [
+            ">seq1 first sequence\nATCGATCG\nGGCC\n>seq2 second\nTTAATTAA\nCC\n",
+            ">seq1 first sequence\r\nATCGATCG\r\nGGCC\r\n>seq2 second\r\nTTAATTAA\r\nCC",
+        ] {
+            let expected = FastaParser.parse(content).unwrap();
+            assert_eq!(expected.len(), 2);
+            assert_eq!(expected[1].sequence, "TTAATTAACC");
+
+            // Tiny chunks force lines to be split across chunk boundaries
+            for chunk_size in [1, 3, 7, 64] {
+                let records = FastaRecords {
+                    reader: FastaReader::new(content.as_bytes(), chunk_size),
+                };
+                let sequences = records.collect::<Result<Vec<_>, _>>().unwrap();
+                assert_eq!(sequences, expected);
+            }
+        }
+    }
+
+    #[test]
+    fn test_fasta_parse_files() {
+        let files: Vec<NamedTempFile> = (0..5)
+            .map(|i| {
+                let mut temp_file = NamedTempFile::new().unwrap();
+                write!(temp_file, ">seq{}\nATCG\n", i).unwrap();
+                temp_file
+            })
+            .collect();
+        let mut paths: Vec<&Path> = files.iter().map(|f| f.path()).collect();
+        paths.push(Path::new("/nonexistent/missing.fasta"));
+
+        let results = FastaParser.parse_files(&paths);
+        assert_eq!(results.len(), 6);
+        for (i, result) in results[..5].iter().enumerate() {
+            assert_eq!(result.as_ref().unwrap()[0].id, format!("seq{}", i));
+        }
+        assert!(results[5].is_err());
+    }
+
+    #[test]
+    fn test_fasta_iter_headers() {
+        let mut temp_file = NamedTempFile::new().unwrap();
+        write!(
+            temp_file,
+            ">seq1 first\nATCG\n>seq2\nGGCC\n>seq3 third one\n"
+        )
+        .unwrap();
+
+        let headers = FastaParser
+            .iter_headers(temp_file.path())
+            .unwrap()
+            .collect::<Result<Vec<_>, _>>()
+            .unwrap();
+        assert_eq!(
+            headers,
+            vec![
+                ("seq1".to_string(), "first".to_string()),
+                ("seq2".to_string(), String::new()),
+                ("seq3".to_string(), "third one".to_string()),
+            ]
+        );
+    }
+
+    #[test]
+    fn test_detect_file_format() {
+        let cases = [
+            ("\n>seq1\nATCG\n", "fasta"),
+            ("@read1\nATCG\n+\nIIII\n", "fastq"),
+            ("LOCUS       TEST 4 bp    DNA     linear\n", "genbank"),
+            ("; exported sequences\n>seq1\nATCG\n", "fasta"),
+            ("header line\nLOCUS       TEST 4 bp\n", "genbank"),
+        ];
+        for (content, expected) in cases {
+            let mut temp_file = NamedTempFile::new().unwrap();
+            write!(temp_file, "{}", content).unwrap();
+            assert_eq!(detect_file_format(temp_file.path()).unwrap(), expected);
+        }
+
+        // Unrecognized content falls back to the extension
+        let temp_file = tempfile::Builder::new().suffix(".gbk").tempfile().unwrap();
+        assert_eq!(detect_file_format(temp_file.path()).unwrap(), "genbank");
+
+        let temp_file = NamedTempFile::new().unwrap();
+        assert!(detect_file_format(temp_file.path()).is_err());
+    }
+
+    #[test]
+    fn test_fasta_parse_file_empty() {
+        let temp_file = NamedTempFile::new().unwrap();
+        assert!(FastaParser.parse_file(temp_file.path()).is_err());
+    }
+}
@@ -1,10 +1,12 @@
 // Infrastructure layer: Storage implementation
 use crate::domain::{Sequence, SequenceMetadata, SequenceRepository, Topology};
+use crate::infrastructure::parsers::{detect_reader_format, FastaParser};
 use serde::{Deserialize, Serialize};
-use std::collections::HashMap;
-use std::fs::File;
+use std::collections::{HashMap, VecDeque};
+use std::fs::{File, Metadata};
 use std::io::{BufRead, BufReader, Read, Seek, SeekFrom};
 use std::path::{Path, PathBuf};
+use std::time::SystemTime;
 use thiserror::Error;
 
 #[derive(Error, Debug)]
@@ -33,11 +35,58 @@ pub enum SequenceSource {
     File { path: PathBuf, offset: ByteOffset },
 }
 
+/// Number of file imports kept in the import cache
+const MAX_CACHED_IMPORTS: usize = 32;
+
+/// Files up to this size are parsed into memory; larger ones are indexed (1 MiB)
+const IN_MEMORY_IMPORT_LIMIT: u64 = 1 << 20;
+
+/// Read buffer for scanning indexed files; sequential scans over large files
+/// are much faster with fewer, larger reads than the 8 KiB default (1 MiB)
+const LARGE_FILE_BUF_SIZE: usize = 1 << 20;
+
+/// First bytes of FASTA/FASTQ lines that are not sequence data
+const NON_SEQUENCE_MARKERS: [u8; 3] = [b'>', b'@', b'+'];
+
+/// Whether a trimmed line is a header or FASTQ separator line
+fn is_marker_line(line: &[u8]) -> bool {
+    line.first()
+        .is_some_and(|b| NON_SEQUENCE_MARKERS.contains(b))
+}
+
+/// ファイルが変更されていないことを識別するキャッシュキー
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+struct ImportCacheKey {
+    path: PathBuf,
+    format: String,
+    len: u64,
+    modified: Option<SystemTime>,
+}
+
+impl ImportCacheKey {
+    fn new(file_path: &Path, format: &str, metadata: &Metadata) -> Self {
+        Self {
+            path: file_path
+                .canonicalize()
+                .unwrap_or_else(|_| file_path.to_path_buf()),
+            format: format.to_string(),
+            len: metadata.len(),
+            modified: metadata.modified().ok(),
+        }
+    }
+}
+
 /// Infrastructure層でのRepositoryトレイト実装
 pub struct FileSequenceRepository {
     pub sequences: HashMap<String, SequenceSource>,
     pub metadata: HashMap<String, SequenceMetadata>,
     next_id: usize,
+    /// Recent file imports keyed by path, format, size and mtime, evicting the
+    /// least recently used entry once `MAX_CACHED_IMPORTS` is reached. In-memory
+    /// imports are held here and in `sequences`, so each one is stored twice;
+    /// that is bounded by `MAX_CACHED_IMPORTS` x `IN_MEMORY_IMPORT_LIMIT`
+    import_cache: HashMap<ImportCacheKey, (SequenceSource, SequenceMetadata)>,
+    import_cache_order: VecDeque<ImportCacheKey>,
 }
 
 impl FileSequenceRepository {
@@ -46,9 +95,17 @@ impl FileSequenceRepository {
             sequences: HashMap::new(),
             metadata: HashMap::new(),
             next_id: 1,
+            import_cache: HashMap::new(),
+            import_cache_order: VecDeque::new(),
         }
     }
 
+    /// Drop all cached file imports
+    pub fn clear_cache(&mut self) {
+        self.import_cache.clear();
+        self.import_cache_order.clear();
+    }
+
     pub fn generate_id(&mut self) -> String {
         let id = format!("seq_{}", self.next_id);
         self.next_id += 1;
@@ -67,9 +124,9 @@ impl FileSequenceRepository {
                 // Save previous sequence if exists
                 if !current_id.is_empty() {
                     sequences.push(Sequence {
-                        id: current_id.clone(),
-                        name: current_name.clone(),
-                        sequence: current_sequence.clone(),
+                        id: std::mem::take(&mut current_id),
+                        name: std::mem::take(&mut current_name),
+                        sequence: std::mem::take(&mut current_sequence),
                         topology: Topology::Linear,
                     });
                 }
@@ -143,29 +200,34 @@ impl FileSequenceRepository {
             }
         };
 
-        if sequences.is_empty() {
-            return Err(StorageError::ParseError("No sequences found".to_string()));
-        }
+        self.store_first_sequence(sequences, None)
+    }
 
+    /// Store the first parsed sequence in memory and return its ID
+    fn store_first_sequence(
+        &mut self,
+        sequences: Vec<Sequence>,
+        file_path: Option<&Path>,
+    ) -> Result<String, StorageError> {
         // For simplicity, just use the first sequence
-        let sequence = &sequences[0];
+        let sequence = sequences
+            .into_iter()
+            .next()
+            .ok_or_else(|| StorageError::ParseError("No sequences found".to_string()))?;
         let seq_id = self.generate_id();
 
-        // Store in memory for text import
-        self.sequences.insert(
-            seq_id.clone(),
-            SequenceSource::Memory(sequence.sequence.clone()),
-        );
         self.metadata.insert(
             seq_id.clone(),
             SequenceMetadata {
-                id: sequence.id.clone(),
-                name: sequence.name.clone(),
+                id: sequence.id,
+                name: sequence.name,
                 length: sequence.sequence.len(),
-                topology: sequence.topology.clone(),
-                file_path: None,
+                topology: sequence.topology,
+                file_path: file_path.map(Path::to_path_buf),
             },
         );
+        self.sequences
+            .insert(seq_id.clone(), SequenceSource::Memory(sequence.sequence));
 
         Ok(seq_id)
     }
@@ -178,10 +240,47 @@ impl FileSequenceRepository {
         let mut file = File::open(file_path)?;
         let metadata = file.metadata()?;
 
+        // Sniff the format from the handle we already have, then rewind it
+        let format = if format == "auto" {
+            let format = detect_reader_format(&mut file, file_path)
+                .map_err(|e| StorageError::ParseError(e.to_string()))?;
+            file.rewind()?;
+            format
+        } else {
+            format
+        };
+
+        // Re-importing an unchanged file reuses the previous parse
+        let cache_key = ImportCacheKey::new(file_path, format, &metadata);
+        if let Some((source, meta)) = self.import_cache.get(&cache_key) {
+            let (source, meta) = (source.clone(), meta.clone());
+
+            // A hit makes the entry the most recently used
+            if let Some(pos) = self
+                .import_cache_order
+                .iter()
+                .position(|key| *key == cache_key)
+            {
+                self.import_cache_order.remove(pos);
+            }
+            self.import_cache_order.push_back(cache_key);
+
+            let seq_id = self.generate_id();
+            self.sequences.insert(seq_id.clone(), source);
+            self.metadata.insert(seq_id.clone(), meta);
+            return Ok(seq_id);
+        }
+
         // For large files, use indexed access
-        if metadata.len() > 1024 * 1024 {
-            // 1MB threshold
-            self.import_large_file(file_path, format)
+        let seq_id = if metadata.len() > IN_MEMORY_IMPORT_LIMIT {
+            self.import_large_file(file, file_path, format)?
+        } else if format == "fasta" {
+            // Only the first record is kept, so stop reading once it is complete
+            let first = FastaParser
+                .iter_records_from(file)
+                .and_then(|mut records| records.next().transpose())
+                .map_err(|e| StorageError::ParseError(e.to_string()))?;
+            self.store_first_sequence(first.into_iter().collect(), Some(file_path))?
         } else {
             // For small files, load into memory
             let mut content = String::new();
@@ -193,17 +292,36 @@ impl FileSequenceRepository {
                 meta.file_path = Some(file_path.to_path_buf());
             }
 
-            Ok(seq_id)
+            seq_id
+        };
+
+        self.cache_import(cache_key, &seq_id);
+        Ok(seq_id)
+    }
+
+    fn cache_import(&mut self, key: ImportCacheKey, seq_id: &str) {
+        let (Some(source), Some(meta)) = (self.sequences.get(seq_id), self.metadata.get(seq_id))
+        else {
+            return;
+        };
+        let entry = (source.clone(), meta.clone());
+
+        if self.import_cache_order.len() >= MAX_CACHED_IMPORTS {
+            if let Some(oldest) = self.import_cache_order.pop_front() {
+                self.import_cache.remove(&oldest);
+            }
         }
+        self.import_cache_order.push_back(key.clone());
+        self.import_cache.insert(key, entry);
     }
 
     fn import_large_file(
         &mut self,
+        file: File,
         file_path: &Path,
         format: &str,
     ) -> Result<String, StorageError> {
-        let file = File::open(file_path)?;
-        let mut reader = BufReader::new(file);
+        let mut reader = BufReader::with_capacity(LARGE_FILE_BUF_SIZE, file);
         let mut line = String::new();
 
         // Find the first sequence header and data
@@ -212,6 +330,17 @@ impl FileSequenceRepository {
         let mut sequence_length = 0usize;
         let mut id = String::new();
         let mut name = String::new();
+        // Only FASTA and FASTQ can be indexed; fail before scanning the file
+        let header_marker = match format {
+            "fasta" => '>',
+            "fastq" => '@',
+            _ => {
+                return Err(StorageError::ParseError(format!(
+                    "Unsupported format for large files: {}",
+                    format
+                )))
+            }
+        };
 
         // Find header
         loop {
@@ -221,9 +350,7 @@ impl FileSequenceRepository {
                 return Err(StorageError::ParseError("No sequence found".to_string()));
             }
 
-            if (format == "fasta" && line.starts_with('>'))
-                || (format == "fastq" && line.starts_with('@'))
-            {
+            if line.starts_with(header_marker) {
                 let header = &line[1..].trim();
                 let parts: Vec<&str> = header.split_whitespace().collect();
                 id = parts.first().unwrap_or(&"unknown").to_string();
@@ -235,22 +362,22 @@ impl FileSequenceRepository {
             header_pos += bytes_read as u64;
         }
 
-        // Count sequence length
+        // Count sequence length; data lines are scanned as raw bytes so
+        // they are neither UTF-8 validated nor copied into a String
+        let mut line = Vec::new();
         loop {
             line.clear();
-            let bytes_read = reader.read_line(&mut line)?;
+            let bytes_read = reader.read_until(b'\n', &mut line)?;
             if bytes_read == 0 {
                 break;
             }
 
-            let trimmed = line.trim();
-            if trimmed.starts_with('>') || trimmed.starts_with('@') || trimmed.starts_with('+') {
+            let trimmed = line.trim_ascii();
+            if is_marker_line(trimmed) {
                 break;
             }
 
-            if !trimmed.is_empty() {
-                sequence_length += trimmed.len();
-            }
+            sequence_length += trimmed.len();
         }
 
         let seq_id = self.generate_id();
@@ -302,42 +429,39 @@ impl FileSequenceRepository {
         let end = end.min(offset.length);
 
         let mut file = File::open(path)?;
-        let mut reader = BufReader::new(file);
+        let mut reader = BufReader::with_capacity(LARGE_FILE_BUF_SIZE, file);
 
         // Seek to the data start
         reader.seek(SeekFrom::Start(offset.start))?;
 
-        let mut result = String::new();
+        let mut result = String::with_capacity(end - start);
         let mut current_pos = 0;
-        let mut line = String::new();
+        let mut buf = Vec::new();
 
         while current_pos < end {
-            line.clear();
-            let bytes_read = reader.read_line(&mut line)?;
+            buf.clear();
+            let bytes_read = reader.read_until(b'\n', &mut buf)?;
             if bytes_read == 0 {
                 break;
             }
 
-            let trimmed = line.trim();
+            let line = buf.trim_ascii();
             // Skip header lines and empty lines
-            if trimmed.starts_with('>')
-                || trimmed.starts_with('@')
-                || trimmed.starts_with('+')
-                || trimmed.is_empty()
-            {
+            if line.is_empty() || is_marker_line(line) {
                 continue;
             }
 
-            // Process each character in the line
-            for ch in trimmed.chars() {
-                if current_pos >= start && current_pos < end {
-                    result.push(ch.to_ascii_uppercase());
-                }
-                current_pos += 1;
-                if current_pos >= end {
-                    break;
-                }
+            // Copy the part of the line that overlaps the window in one go
+            if current_pos + line.len() > start {
+                let from = start.saturating_sub(current_pos);
+                let to = line.len().min(end - current_pos);
+                result.extend(
+                    line[from..to]
+                        .iter()
+                        .map(|&b| char::from(b.to_ascii_uppercase())),
+                );
             }
+            current_pos += line.len();
         }
 
         Ok(result)
@@ -415,3 +539,117 @@ impl SequenceRepository for FileSequenceRepository {
         }
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use std::io::Write;
+    use tempfile::NamedTempFile;
+
+    #[test]
+    fn test_import_cache_reuses_unchanged_file() {
+        let mut temp_file = NamedTempFile::new().unwrap();
+        writeln!(temp_file, ">cached_seq\nATCGATCG").unwrap();
+
+        let mut repository = FileSequenceRepository::new();
+        let first = repository
+            .import_from_file(temp_file.path(), "fasta")
+            .unwrap();
+        let second = repository
+            .import_from_file(temp_file.path(), "fasta")
+            .unwrap();
+
+        assert_ne!(first, second);
+        assert_eq!(repository.import_cache.len(), 1);
+        assert_eq!(repository.get_sequence(&second).unwrap(), "ATCGATCG");
+
+        // Changing the file invalidates the cached entry
+        writeln!(temp_file, "GGCC").unwrap();
+        let third = repository
+            .import_from_file(temp_file.path(), "fasta")
+            .unwrap();
+        assert_eq!(repository.get_sequence(&third).unwrap(), "ATCGATCGGGCC");
+
+        repository.clear_cache();
+        assert!(repository.import_cache.is_empty());
+    }
+
+    #[test]
+    fn test_import_cache_evicts_least_recently_used() {
+        let files: Vec<NamedTempFile> = (0..=MAX_CACHED_IMPORTS)
+            .map(|i| {
+                let mut temp_file = NamedTempFile::new().unwrap();
+                writeln!(temp_file, ">seq{}\nATCG", i).unwrap();
+                temp_file
+            })
+            .collect();
+
+        let mut repository = FileSequenceRepository::new();
+        for file in &files[..MAX_CACHED_IMPORTS] {
+            repository.import_from_file(file.path(), "fasta").unwrap();
+        }
+
+        // Re-importing the oldest entry keeps it past the next eviction
+        let key = |file: &NamedTempFile| {
+            ImportCacheKey::new(file.path(), "fasta", &file.as_file().metadata().unwrap())
+        };
+        repository
+            .import_from_file(files[0].path(), "fasta")
+            .unwrap();
+        repository
+            .import_from_file(files[MAX_CACHED_IMPORTS].path(), "fasta")
+            .unwrap();
+
+        assert_eq!(repository.import_cache.len(), MAX_CACHED_IMPORTS);
+        assert!(repository.import_cache.contains_key(&key(&files[0])));
+        assert!(!repository.import_cache.contains_key(&key(&files[1])));
+    }
+
+    #[test]
+    fn test_import_auto_detects_format() {
+        let mut temp_file = NamedTempFile::new().unwrap();
+        writeln!(temp_file, "@read1 sample\nACGT\n+\nIIII").unwrap();
+
+        let mut repository = FileSequenceRepository::new();
+        let seq_id = repository
+            .import_from_file(temp_file.path(), "auto")
+            .unwrap();
+
+        // The sniffed head must not be lost before the file is parsed
+        assert_eq!(repository.get_sequence(&seq_id).unwrap(), "ACGT");
+        assert_eq!(repository.get_metadata(&seq_id).unwrap().id, "read1");
+    }
+
+    #[test]
+    fn test_file_backed_window() {
+        // Larger than the in-memory threshold, so the file is indexed
+        let line = "acgtacgtac".repeat(6);
+        let lines = 20_000;
+        let mut temp_file = NamedTempFile::new().unwrap();
+        writeln!(temp_file, ">large_seq indexed").unwrap();
+        for _ in 0..lines {
+            writeln!(temp_file, "{}", line).unwrap();
+        }
+
+        let mut repository = FileSequenceRepository::new();
+        let seq_id = repository
+            .import_from_file(temp_file.path(), "fasta")
+            .unwrap();
+        assert!(matches!(
+            repository.sequences.get(&seq_id),
+            Some(SequenceSource::File { .. })
+        ));
+
+        let expected = line.repeat(lines).to_ascii_uppercase();
+        for (start, end) in [(0, 10), (55, 65), (59, 181), (119_990, 120_030)] {
+            assert_eq!(
+                repository.get_window(&seq_id, start, end).unwrap(),
+                expected[start..end]
+            );
+        }
+        let tail = repository
+            .get_window(&seq_id, 1_199_990, usize::MAX)
+            .unwrap();
+        assert_eq!(tail, expected[1_199_990..]);
+    }
+}
@@ -30,12 +30,14 @@ impl FastaRecord {
 
     pub fn calculate_stats(&self) -> SequenceStats {
         let length = self.sequence.len();
-        let gc_count = self
-            .sequence
-            .chars()
-            .filter(|&c| c == 'G' || c == 'C')
-            .count();
-        let n_count = self.sequence.chars().filter(|&c| c == 'N').count();
+        let (mut gc_count, mut n_count) = (0usize, 0usize);
+        for &b in self.sequence.as_bytes() {
+            match b {
+                b'G' | b'C' => gc_count += 1,
+                b'N' => n_count += 1,
+                _ => {}
+            }
+        }
 
         let gc_percent = if length > 0 {
             (gc_count as f64 / length as f64) * 100.0
@@ -64,42 +66,56 @@ pub fn parse_fasta(content: &str) -> Result<Vec<FastaRecord>, ParseError> {
     let mut current_id = String::new();
     let mut current_desc = None;
     let mut current_seq = String::new();
+    let mut needs_strip = false;
 
+    // Sequence lines are appended whole and normalized once per record, so
+    // records are built directly instead of going through FastaRecord::new.
     for line in content.lines() {
         if line.starts_with('>') {
             // Save previous record if exists
             if !current_id.is_empty() {
-                records.push(FastaRecord::new(
-                    current_id.clone(),
-                    current_desc.clone(),
-                    current_seq.clone(),
-                ));
-                current_seq.clear();
+                normalize_sequence(&mut current_seq, needs_strip);
+                records.push(FastaRecord {
+                    id: std::mem::take(&mut current_id),
+                    description: current_desc.take(),
+                    sequence: std::mem::take(&mut current_seq),
+                });
             }
+            needs_strip = false;
 
             // Parse header
             let header = &line[1..].trim_start(); // Remove '>' and leading whitespace
-            let parts: Vec<&str> = header.splitn(2, |c: char| c.is_whitespace()).collect();
-
-            current_id = parts[0].to_string();
-            current_desc = if parts.len() > 1 && !parts[1].is_empty() {
-                Some(parts[1].to_string())
-            } else {
-                None
-            };
-        } else if !line.trim().is_empty() {
-            // Accumulate sequence
-            current_seq.push_str(line.trim());
+            let (id, desc) = header
+                .split_once(char::is_whitespace)
+                .unwrap_or((header, ""));
+
+            current_id = id.to_string();
+            current_desc = (!desc.is_empty()).then(|| desc.to_string());
+        } else {
+            let line = line.trim();
+            // Interior whitespace is rare; non-ASCII bytes are flagged too so
+            // Unicode whitespace is still caught by the slow path
+            needs_strip |= line
+                .bytes()
+                .any(|b| b.is_ascii_whitespace() || !b.is_ascii());
+            current_seq.push_str(line);
         }
     }
 
     // Save last record if exists
     if !current_id.is_empty() {
-        records.push(FastaRecord::new(current_id, current_desc, current_seq));
+        normalize_sequence(&mut current_seq, needs_strip);
+        records.push(FastaRecord {
+            id: current_id,
+            description: current_desc,
+            sequence: current_seq,
+        });
     }
 
-    // Check for invalid format (no sequences starting with >)
-    if !content.is_empty() && !content.trim().is_empty() && !content.trim().starts_with('>') {
+    // Check for invalid format (no sequences starting with >); only the
+    // start of the content matters, so there is no need to trim both ends
+    let head = content.trim_start();
+    if !head.is_empty() && !head.starts_with('>') {
         return Err(ParseError::InvalidFormat(
             "FASTA content must start with '>'".to_string(),
         ));
@@ -108,6 +124,15 @@ pub fn parse_fasta(content: &str) -> Result<Vec<FastaRecord>, ParseError> {
     Ok(records)
 }
 
+/// Uppercase an accumulated sequence in place, removing interior whitespace
+/// only when a line contained some
+fn normalize_sequence(sequence: &mut String, needs_strip: bool) {
+    if needs_strip {
+        sequence.retain(|c| !c.is_whitespace());
+    }
+    sequence.make_ascii_uppercase();
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -142,4 +167,13 @@ mod tests {
 
         assert_eq!(records[0].sequence, "ATCG");
     }
+
+    #[test]
+    fn test_interior_whitespace_removed() {
+        let content = ">seq1\nac gt\tn\n  tt  \r\n>seq2\nggcc\n";
+        let records = parse_fasta(content).unwrap();
+
+        assert_eq!(records[0].sequence, "ACGTNTT");
+        assert_eq!(records[1].sequence, "GGCC");
+    }
 }
@@ -200,27 +200,15 @@ impl PrimerDesignServiceImpl {
         // Tm差が大きすぎる場合は不適合
         let tm_diff = (forward.tm - reverse.tm).abs();
         if tm_diff > 3.0 {
-            println!(
-                "DEBUG: Pair rejected for Tm diff: {:.2} (forward: {:.2}°C, reverse: {:.2}°C)",
-                tm_diff, forward.tm, reverse.tm
-            );
             return false;
         }
 
         // プライマー間の相互作用をチェック
         let hetero_dimer = self.calculate_hetero_dimer(&forward.sequence, &reverse.sequence);
         if hetero_dimer < params.max_hetero_dimer {
-            println!(
-                "DEBUG: Pair rejected for hetero-dimer: {:.2} < {:.2} (forward: {}, reverse: {})",
-                hetero_dimer, params.max_hetero_dimer, forward.sequence, reverse.sequence
-            );
             return false;
         }
 
-        println!(
-            "DEBUG: Pair accepted - Tm diff: {:.2}, hetero-dimer: {:.2}",
-            tm_diff, hetero_dimer
-        );
         true
     }
 }
@@ -235,13 +223,6 @@ impl PrimerDesignService for PrimerDesignServiceImpl {
         end: usize,
         params: &PrimerDesignParams,
     ) -> Result<PrimerDesignResult, Self::Error> {
-        println!(
-            "DEBUG: Primer design called with sequence length: {}, start: {}, end: {}",
-            sequence.len(),
-            start,
-            end
-        );
-
         if start >= end || end > sequence.len() {
             return Err(anyhow::anyhow!("Invalid target region"));
         }
@@ -253,23 +234,12 @@ impl PrimerDesignService for PrimerDesignServiceImpl {
         let reverse_candidates =
             self.generate_primer_candidates(sequence, start, end, params, PrimerDirection::Reverse);
 
-        println!(
-            "DEBUG: Found {} forward candidates, {} reverse candidates",
-            forward_candidates.len(),
-            reverse_candidates.len()
-        );
-
         let mut pairs = Vec::new();
-        println!("DEBUG: Starting pair compatibility check");
 
         // Generate primer pairs
         for forward in &forward_candidates {
             for reverse in &reverse_candidates {
                 if !self.is_compatible_pair(forward, reverse, params) {
-                    println!(
-                        "DEBUG: Pair failed compatibility check - forward pos: {}, reverse pos: {}",
-                        forward.position, reverse.position
-                    );
                     continue;
                 }
 
@@ -280,16 +250,9 @@ impl PrimerDesignService for PrimerDesignServiceImpl {
 
                 // 適切な増幅産物サイズかチェック
                 if amplicon_length < 100 || amplicon_length > 3000 {
-                    println!("DEBUG: Pair filtered out by amplicon size: {} bp (forward: {}, reverse: {})",
-                             amplicon_length, forward.position, reverse.position);
                     continue;
                 }
 
-                println!(
-                    "DEBUG: Found valid pair - forward: {}, reverse: {}, amplicon: {} bp",
-                    forward.position, reverse.position, amplicon_length
-                );
-
                 let amplicon_sequence = sequence[amplicon_start..amplicon_end].to_string();
 
                 let mut validation = ValidationResults::new();
@@ -319,11 +282,6 @@ impl PrimerDesignService for PrimerDesignServiceImpl {
             }
         }
 
-        println!(
-            "DEBUG: Found {} total valid pairs before sorting",
-            pairs.len()
-        );
-
         // 最良の候補10組まで
         pairs.sort_by(|a, b| {
             // スコアリング: Tm最適値からの差、GC含量、二次構造スコア
@@ -334,8 +292,6 @@ impl PrimerDesignService for PrimerDesignServiceImpl {
 
         pairs.truncate(10);
 
-        println!("DEBUG: Returning {} final pairs", pairs.len());
-
         // Evaluate multiplex compatibility if there are multiple pairs
         let multiplex_compatibility = if pairs.len() > 1 {
             Some(self.evaluate_multiplex(&pairs))
@@ -454,11 +410,6 @@ impl PrimerDesignService for PrimerDesignServiceImpl {
         let mut warnings = Vec::new();
         let mut compatibility_scores = Vec::new();
 
-        println!(
-            "DEBUG: Evaluating multiplex compatibility for {} primer pairs",
-            primers.len()
-        );
-
         for (i, pair1) in primers.iter().enumerate() {
             let mut row = HashMap::new();
             for (j, pair2) in primers.iter().enumerate() {
@@ -468,11 +419,6 @@ impl PrimerDesignService for PrimerDesignServiceImpl {
                         self.analyze_pair_compatibility(pair1, pair2, &mut warnings);
                     row.insert(pair2.id.clone(), compatibility_score);
                     compatibility_scores.push(compatibility_score);
-
-                    println!(
-                        "DEBUG: Compatibility between {} and {}: {:.2}",
-                        pair1.id, pair2.id, compatibility_score
-                    );
                 }
             }
             compatibility_matrix.insert(pair1.id.clone(), row);
@@ -489,9 +435,6 @@ impl PrimerDesignService for PrimerDesignServiceImpl {
             (avg_score + 10.0).max(0.0).min(10.0) / 10.0
         };
 
-        println!("DEBUG: Overall multiplex score: {:.2}", overall_score);
-        println!("DEBUG: Multiplex warnings: {} warnings", warnings.len());
-
         MultiplexCompatibility {
             compatibility_matrix,
             warnings,
@@ -1,6 +1,6 @@
 // Service layer: Statistics service implementation
 use crate::domain::{BaseCount, DetailedStats, StatsService, WindowStats};
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
 
 /// Statistics service implementation
 pub struct StatsServiceImpl;
@@ -11,8 +11,8 @@ impl StatsServiceImpl {
     }
 
     /// Calculate Shannon entropy of a sequence
-    fn calculate_entropy(&self, sequence: &str) -> f64 {
-        let mut freq_map: HashMap<char, usize> = HashMap::new();
+    fn calculate_entropy(&self, sequence: &[u8]) -> f64 {
+        let mut freq = [0usize; 256];
         let length = sequence.len() as f64;
 
         if length == 0.0 {
@@ -20,35 +20,27 @@ impl StatsServiceImpl {
         }
 
         // Count frequencies
-        for c in sequence.chars() {
-            *freq_map.entry(c.to_ascii_uppercase()).or_insert(0) += 1;
+        for &b in sequence {
+            freq[b.to_ascii_uppercase() as usize] += 1;
         }
 
         // Calculate entropy
         let mut entropy = 0.0;
-        for count in freq_map.values() {
-            let p = *count as f64 / length;
-            if p > 0.0 {
-                entropy -= p * p.log2();
-            }
+        for &count in freq.iter().filter(|&&count| count > 0) {
+            let p = count as f64 / length;
+            entropy -= p * p.log2();
         }
 
         entropy
     }
 
     /// Calculate linguistic complexity (ratio of unique k-mers)
-    fn calculate_complexity(&self, sequence: &str) -> f64 {
+    fn calculate_complexity(&self, sequence: &[u8]) -> f64 {
         if sequence.len() < 3 {
             return 0.0;
         }
 
-        let mut unique_3mers = HashMap::new();
-        let chars: Vec<char> = sequence.chars().collect();
-
-        for window in chars.windows(3) {
-            let kmer = window.iter().collect::<String>();
-            *unique_3mers.entry(kmer).or_insert(0) += 1;
-        }
+        let unique_3mers: HashSet<&[u8]> = sequence.windows(3).collect();
 
         let max_possible = (sequence.len() - 2).min(64); // 4^3 = 64 possible 3-mers
         let unique_count = unique_3mers.len();
@@ -60,30 +52,42 @@ impl StatsServiceImpl {
 impl StatsService for StatsServiceImpl {
     fn calculate_detailed_stats(&self, sequence: &str) -> DetailedStats {
         let mut base_counts = BaseCount::new();
-        let mut dinucleotides: HashMap<String, usize> = HashMap::new();
 
-        let chars: Vec<char> = sequence.chars().collect();
-        let length = chars.len();
+        // Sequences are ASCII, so work on the bytes directly
+        let bases = sequence.as_bytes();
+        let length = bases.len();
 
         // Count bases
-        for c in &chars {
-            match c.to_ascii_uppercase() {
-                'A' => base_counts.a += 1,
-                'T' | 'U' => base_counts.t += 1,
-                'G' => base_counts.g += 1,
-                'C' => base_counts.c += 1,
-                'N' => base_counts.n += 1,
+        for b in bases {
+            match b.to_ascii_uppercase() {
+                b'A' => base_counts.a += 1,
+                b'T' | b'U' => base_counts.t += 1,
+                b'G' => base_counts.g += 1,
+                b'C' => base_counts.c += 1,
+                b'N' => base_counts.n += 1,
                 _ => base_counts.other += 1,
             }
         }
 
-        // Count dinucleotides
-        for window in chars.windows(2) {
-            if window.len() == 2 {
-                let dinuc = format!("{}{}", window[0], window[1]).to_uppercase();
-                *dinucleotides.entry(dinuc).or_insert(0) += 1;
-            }
+        // Count dinucleotides into a byte-pair table; the String keys are
+        // only built once per distinct pair
+        let mut pair_counts = vec![0usize; 256 * 256];
+        for window in bases.windows(2) {
+            let first = window[0].to_ascii_uppercase() as usize;
+            let second = window[1].to_ascii_uppercase() as usize;
+            pair_counts[first << 8 | second] += 1;
         }
+        let dinucleotides: HashMap<String, usize> = pair_counts
+            .iter()
+            .enumerate()
+            .filter(|&(_, &count)| count > 0)
+            .map(|(pair, &count)| {
+                let dinuc: String = [(pair >> 8) as u8 as char, pair as u8 as char]
+                    .into_iter()
+                    .collect();
+                (dinuc, count)
+            })
+            .collect();
 
         // Calculate percentages
         let gc_percent = if length > 0 {
@@ -121,10 +125,10 @@ impl StatsService for StatsServiceImpl {
         };
 
         // Calculate Shannon entropy
-        let entropy = self.calculate_entropy(sequence);
+        let entropy = self.calculate_entropy(bases);
 
         // Calculate sequence complexity
-        let complexity = self.calculate_complexity(sequence);
+        let complexity = self.calculate_complexity(bases);
 
         DetailedStats {
             length,
@@ -149,24 +153,24 @@ impl StatsService for StatsServiceImpl {
         step: usize,
     ) -> Vec<WindowStats> {
         let mut stats = Vec::new();
-        let chars: Vec<char> = sequence.chars().collect();
+        let bases = sequence.as_bytes();
 
-        for pos in (0..chars.len()).step_by(step) {
-            if pos + window_size > chars.len() {
+        for pos in (0..bases.len()).step_by(step) {
+            if pos + window_size > bases.len() {
                 break;
             }
 
-            let window_seq: String = chars[pos..pos + window_size].iter().collect();
+            let window_seq = &bases[pos..pos + window_size];
 
             // Calculate GC% for window
             let gc_count = window_seq
-                .chars()
-                .filter(|&c| c == 'G' || c == 'C' || c == 'g' || c == 'c')
+                .iter()
+                .filter(|&&b| matches!(b, b'G' | b'C' | b'g' | b'c'))
                 .count();
             let gc_percent = (gc_count as f64 / window_size as f64) * 100.0;
 
             // Calculate entropy for window
-            let entropy = self.calculate_entropy(&window_seq);
+            let entropy = self.calculate_entropy(window_seq);
 
             stats.push(WindowStats {
                 position: pos,